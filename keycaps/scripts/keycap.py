@@ -5,11 +5,189 @@ Contains the Keycap class which makes it easy to script the generation of
 keycaps using the Keycap Playground.
 """
 
+import os
+import sys
+import copy
 import json
+import shlex
+import reprlib
+import asyncio
+import tempfile
+import functools
+import subprocess
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import keycap_cache
 
 KEY_UNIT = 14.5 # Square that makes up the entire space of a key
 BETWEENSPACE = 0.8 # Space between keycaps
+if os.name == "nt":
+    DEFAULT_OPENSCAD_PATH = Path(r"C:\Program Files\OpenSCAD\openscad.exe")
+else:
+    DEFAULT_OPENSCAD_PATH = Path("openscad") # Whatever is in the $PATH
+
+# Keycap Playground variable -> Keycap attribute (in the order they get passed
+# to OpenSCAD):
+_SCAD_VARS = (
+    ("RENDER", "render"),
+    ("KEY_PROFILE", "key_profile"),
+    ("KEY_LENGTH", "key_length"),
+    ("KEY_WIDTH", "key_width"),
+    ("KEY_TOP_DIFFERENCE", "key_top_difference"),
+    ("KEY_ROTATION", "key_rotation"),
+    ("KEY_HEIGHT", "key_height"),
+    ("WALL_THICKNESS", "wall_thickness"),
+    ("UNIFORM_WALL_THICKNESS", "uniform_wall_thickness"),
+    ("DISH_THICKNESS", "dish_thickness"),
+    ("DISH_INVERT", "dish_invert"),
+    ("DISH_TYPE", "dish_type"),
+    ("DISH_DEPTH", "dish_depth"),
+    ("DISH_TILT", "dish_tilt"),
+    ("DISH_TILT_CURVE", "dish_tilt_curve"),
+    ("DISH_FN", "dish_fn"),
+    ("DISH_CORNER_FN", "dish_corner_fn"),
+    ("POLYGON_LAYERS", "polygon_layers"),
+    ("POLYGON_LAYER_ROTATION", "polygon_layer_rotation"),
+    ("POLYGON_EDGES", "polygon_edges"),
+    ("POLYGON_ROTATION", "polygon_rotation"),
+    ("CORNER_RADIUS", "corner_radius"),
+    ("CORNER_RADIUS_CURVE", "corner_radius_curve"),
+    ("STEM_TYPE", "stem_type"),
+    ("STEM_TOP_THICKNESS", "stem_top_thickness"),
+    ("STEM_INSET", "stem_inset"),
+    ("STEM_INSIDE_TOLERANCE", "stem_inside_tolerance"),
+    ("STEM_OUTSIDE_TOLERANCE_X", "stem_outside_tolerance_x"),
+    ("STEM_OUTSIDE_TOLERANCE_Y", "stem_outside_tolerance_y"),
+    ("STEM_SIDE_SUPPORTS", "stem_side_supports"),
+    ("STEM_SIDES_WALL_THICKNESS", "stem_sides_wall_thickness"),
+    ("STEM_LOCATIONS", "stem_locations"),
+    ("STEM_SNAP_FIT", "stem_snap_fit"),
+    ("STEM_WALLS_INSET", "stem_walls_inset"),
+    ("STEM_WALLS_TOLERANCE", "stem_walls_tolerance"),
+    ("HOMING_DOT_LENGTH", "homing_dot_length"),
+    ("HOMING_DOT_WIDTH", "homing_dot_width"),
+    ("HOMING_DOT_X", "homing_dot_x"),
+    ("HOMING_DOT_Y", "homing_dot_y"),
+    ("HOMING_DOT_Z", "homing_dot_z"),
+    ("LEGENDS", "legends"),
+    ("LEGEND_FONTS", "fonts"),
+    ("LEGEND_FONT_SIZES", "font_sizes"),
+    ("LEGEND_TRANS", "trans"),
+    ("LEGEND_TRANS2", "trans2"),
+    ("LEGEND_ROTATION", "rotation"),
+    ("LEGEND_ROTATION2", "rotation2"),
+    ("LEGEND_SCALE", "scale"),
+    ("LEGEND_UNDERSET", "underset"),
+)
+
+# Variables holding (lists of) [x,y,z]-style numbers.  These differ from keycap
+# to keycap so they skip the scad_literal() cache and go straight to the (C)
+# JSON encoder:
+_VECTOR_VARS = frozenset((
+    "KEY_ROTATION", "STEM_SIDE_SUPPORTS", "STEM_LOCATIONS",
+    "LEGEND_FONT_SIZES", "LEGEND_TRANS", "LEGEND_TRANS2", "LEGEND_ROTATION",
+    "LEGEND_ROTATION2", "LEGEND_SCALE", "LEGEND_UNDERSET",
+))
+
+def _freeze(value):
+    """
+    Returns a hashable version of *value* (lists become tuples) for use as a
+    cache key.  Types are kept so that e.g. `1`, `1.0`, and `True` (which all
+    compare equal but encode differently) don't share a cache entry.  Floats
+    are keyed by their exact bits (`float.hex()`) so `0.0` and `-0.0` don't
+    either.
+    """
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze(v) for v in value))
+    if type(value) is float:
+        return (float, value.hex())
+    return (type(value), value)
+
+def _thaw(frozen):
+    """
+    The opposite of `_freeze()`.
+    """
+    kind, value = frozen
+    if kind is list:
+        return [_thaw(v) for v in value]
+    if kind is float:
+        return float.fromhex(value)
+    return value
+
+@functools.lru_cache(maxsize=4096)
+def _scad_literal_cached(frozen):
+    return json.dumps(_thaw(frozen), separators=(",", ":"), ensure_ascii=False)
+
+def scad_literal(value):
+    """
+    Returns *value* as an OpenSCAD literal (which for strings, numbers, bools,
+    and lists is the same thing as JSON).  Results are cached since most
+    keycaps in a layout share the majority of their values.
+    """
+    if type(value) in (int, float): # Most common case; repr() == json.dumps()
+        return repr(value)
+    try:
+        return _scad_literal_cached(_freeze(value))
+    except TypeError: # Unhashable (e.g. a dict); just encode it
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+def _openscad_exe(openscad_path):
+    """
+    Returns *openscad_path* as a string suitable for use as `argv[0]` (old
+    scripts wrapped it in literal double quotes for the shell's sake).
+    """
+    return str(openscad_path).strip('"')
+
+def _join_args(args):
+    """
+    Joins *args* into a single command line using the quoting rules of the
+    platform's shell.
+    """
+    if sys.platform == "win32":
+        return subprocess.list2cmdline(args)
+    return shlex.join(args)
+
+# The fields shown by repr(keycap) (the rest are rarely interesting)
+_REPR_FIELDS = (
+    "name", "render", "key_profile", "legends", "trans", "trans2",
+    "rotation", "rotation2", "scale", "underset",
+)
+_REPR = reprlib.Repr() # Keeps repr() short even with lots of legends
+_REPR.maxlist = 6
+_REPR.maxstring = 60
+
+_OPENSCAD_CAPS = {} # openscad_path -> set of optional features it supports
+
+def openscad_caps(openscad_path):
+    """
+    Returns the set of optional capabilities supported by the OpenSCAD at
+    *openscad_path*:  "backend" means it supports `--backend=<name>`,
+    "export-format" means it supports `--export-format=<format>`, while
+    "manifold" and "fast-csg" mean they can be turned on via `--enable`.
+    The result gets cached so OpenSCAD only gets asked once per path.
+    """
+    key = str(openscad_path)
+    if key not in _OPENSCAD_CAPS:
+        caps = set()
+        retcode, output = _run_one([_openscad_exe(openscad_path), "--help"])
+        if "--backend" in output:
+            caps.add("backend")
+        if "--export-format" in output:
+            caps.add("export-format")
+        for feature in ("manifold", "fast-csg"):
+            if feature in output: # Listed under --enable
+                caps.add(feature)
+        _OPENSCAD_CAPS[key] = caps
+    return _OPENSCAD_CAPS[key]
+
+def seed_openscad_caps(caps):
+    """
+    Pre-populates the `openscad_caps()` cache from *caps* (a dict of
+    `{str(openscad_path): caps}`).  Meant to be used as a process pool
+    initializer so worker processes reuse what the parent already found out
+    instead of each running `openscad --help` again.
+    """
+    _OPENSCAD_CAPS.update(caps)
 
 class Keycap(object):
     """
@@ -21,6 +199,7 @@ class Keycap(object):
         '''
         Base keycap definitions for keycaps using Gotham Rounded.
         '''
+        __slots__ = ()
         def __init__(self, **kwargs):
             super().__init__(**kwargs)
             self.key_profile = "gem"
@@ -58,9 +237,51 @@ class Keycap(object):
 
     To actually generate a keycap you can use something like this::
 
-        from subprocess import getstatusoutput
-        retcode, output = getstatusoutput(str(tilde))
+        retcode, output = tilde.generate()
+
+    ...or `tilde.cached_render()` to skip re-rendering keycaps that are identical
+    to ones you've already made.
+
+    To render a whole bunch of keycaps (e.g. a full layout) in one go::
+
+        results = Keycap.render_batch([tilde, ...], out_dir="/tmp/keycaps")
+
+    ...or in parallel (one OpenSCAD process per CPU core)::
+
+        from keycap import render_all
+        results = render_all([tilde, ...])
+
+    ...or, if you'd rather render them one at a time::
+
+        with KeycapServer() as server:
+            retcode, output = server.render(tilde)
+
+    .. note::
+
+        `Keycap` uses `__slots__` to keep instances small.  Subclasses should
+        declare `__slots__ = ()` (as long as they don't add any attributes of
+        their own) so they keep the same compact layout; otherwise each
+        instance gets a `__dict__` again.
     """
+    __slots__ = (
+        "name", "output_path", "render", "key_height", "key_length",
+        "key_width", "key_profile", "key_top_difference", "key_rotation",
+        "wall_thickness", "dish_thickness", "dish_invert", "dish_type",
+        "dish_depth", "dish_tilt", "dish_tilt_curve", "dish_fn",
+        "dish_corner_fn", "uniform_wall_thickness", "polygon_layers",
+        "polygon_layer_rotation", "polygon_edges", "polygon_rotation",
+        "corner_radius", "corner_radius_curve", "stem_type",
+        "stem_top_thickness", "stem_inset", "stem_inside_tolerance",
+        "stem_outside_tolerance_x", "stem_outside_tolerance_y",
+        "stem_locations", "stem_side_supports", "stem_sides_wall_thickness",
+        "stem_snap_fit", "stem_walls_inset", "stem_walls_tolerance",
+        "homing_dot_length", "homing_dot_width", "homing_dot_x", "homing_dot_y",
+        "homing_dot_z", "legends", "fonts", "font_sizes", "trans", "trans2",
+        "rotation", "rotation2", "scale", "underset", "legend_carved",
+        "keycap_playground_path", "openscad_path", "backend",
+        "export_format", "_cmd_cache",
+    )
+
     def __init__(self,
             name=None, render=["keycap", "stem"],
             key_profile="riskeycap",
@@ -109,8 +330,10 @@ class Keycap(object):
             scale=[[1,1,1]], underset=[[0,0,0]],
             legend_carved=False,
             keycap_playground_path=Path("."),
-            openscad_path=Path('"C:\Program Files\OpenSCAD\openscad.exe"'),
-            output_path=Path(".")):
+            openscad_path=DEFAULT_OPENSCAD_PATH,
+            output_path=Path("."),
+            backend="manifold",
+            export_format="binstl"):
         self.name = name
         self.output_path = output_path
         self.render = render
@@ -170,116 +393,408 @@ class Keycap(object):
         self.legend_carved = legend_carved
         self.keycap_playground_path = keycap_playground_path
         self.openscad_path = openscad_path
+        self.backend = backend
+        self.export_format = export_format # binstl is ~5x smaller than asciistl
 
-    # NOTE: This doesn't seem to work right for unknown reasons so you'll want
-    #       to generate the quote keycap by hand on the command line.
-    def quote(self, legends):
+    def __repr__(self):
+        fields = ", ".join(
+            f"{f}={_REPR.repr(getattr(self, f))}" for f in _REPR_FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+    def __rich_repr__(self):
         """
-        Checks for the edge case of a single quote (') legend and converts it
-        into `"'"'"'"` so that bash will pass it correclty to OpenSCAD via
-        `getstatusoutput()`.  Also covers the slash (\\) legend for
-        completeness.
+        Lets `rich` (if you use it) pretty-print keycaps field by field.
+        """
+        for f in _REPR_FIELDS:
+            yield f, getattr(self, f)
 
-        .. note::
+    def param_dict(self):
+        """
+        Returns a dict mapping each Keycap Playground variable (e.g.
+        `KEY_PROFILE`) to the value this keycap sets it to.  Order matters;
+        it's the order the variables get passed to OpenSCAD.
+        """
+        params = {var: getattr(self, attr) for var, attr in _SCAD_VARS}
+        params["KEY_LENGTH"] = round(self.key_length,2)
+        params["KEY_WIDTH"] = round(self.key_width,2)
+        return params
 
-            Example of what it should look like: `LEGENDS="["'"'"'", "", "\""]";`
+    def openscad_flags(self):
         """
-        properly_escaped_quote = ''
-        out = "["
-        for i, legend in enumerate(legends):
-            if legend == "'":
-                out += "\\\"" + "'" + "\\\","
-            elif legend == '"':
-                out += r'"\""'
-            else:
-                out += "\\\"" + legend + "\\\","
-        out = out.rstrip(',') # Get rid of trailing comma
-        return out + "]"
+        Returns a list of the extra OpenSCAD command line flags needed to use
+        `self.backend` and `self.export_format`.  Older builds of OpenSCAD
+        that don't support the Manifold backend (or fast-csg) get no backend
+        flags (CGAL) and ones without `--export-format` get their default
+        (ASCII) STL output.
+        """
+        caps = openscad_caps(self.openscad_path)
+        flags = []
+        if "export-format" in caps:
+            flags.append(f"--export-format={self.export_format}")
+        if "backend" in caps:
+            flags.append(f"--backend={self.backend}")
+        elif self.backend == "manifold": # Older (experimental feature) builds
+            for feature in ("manifold", "fast-csg"):
+                if feature in caps:
+                    flags.append(f"--enable={feature}")
+        return flags
 
-    def __repr__(self):
-        return f"""        name: {self.name}
-        render: {self.render}
-        key_profile: {self.key_profile}
-        legends: {self.legends}
-        trans: {self.trans}
-        trans2: {self.trans2}
-        rotation: {self.rotation}
-        rotation2: {self.rotation2}
-        scale: {self.scale}
-        underset: {self.underset}"""
-
-    def str_fmt(self, var):
-        return json.dumps(var).replace('"', '\\"')
-    
-    def __str__(self):
+    def argv(self):
+        """
+        Returns the OpenSCAD command as a list of arguments suitable for
+        `subprocess.run()` *without* a shell.  Since no shell is involved
+        nothing needs escaping; values are passed as plain OpenSCAD (JSON)
+        literals, legends included.
+        """
+        return list(self._command()[0])
+
+    def _command(self):
         """
-        Returns the OpenSCAD command line to use to generate this keycap.
+        Returns (and caches) `(argv, command_line)` for this keycap.  See the
+        note in `__str__()` about when the cache gets invalidated.
         """
+        cmd = getattr(self, "_cmd_cache", None)
+        if cmd is not None:
+            return cmd
+        args = [_openscad_exe(self.openscad_path)] + self.openscad_flags()
+        args += ["-o", str(Path(self.output_path) / f"{self.name}.stl")]
         # NOTE: Since OpenSCAD requires double quotes I'm using the json module
         #       to encode things that need it:
-        return (
-            f"{self.openscad_path} -o "#--enable=fast-csg -o "
-            f"{self.output_path}\{self.name}.stl "
-            f'-D RENDER="{self.str_fmt(self.render)}" '
-            f'-D KEY_PROFILE="{self.str_fmt(self.key_profile)}" '
-            f'-D KEY_LENGTH="{round(self.key_length,2)}" '
-            f'-D KEY_WIDTH="{round(self.key_width,2)}" '
-            f'-D KEY_TOP_DIFFERENCE="{self.key_top_difference}" '
-            f'-D KEY_ROTATION="{self.key_rotation}" '
-            f'-D KEY_HEIGHT="{self.key_height}" '
-            f'-D WALL_THICKNESS="{self.wall_thickness}" '
-            f'-D UNIFORM_WALL_THICKNESS="{self.str_fmt(self.uniform_wall_thickness)}" '
-            f'-D DISH_THICKNESS="{self.dish_thickness}" '
-            f'-D DISH_INVERT="{self.str_fmt(self.dish_invert)}" '
-            f'-D DISH_TYPE="{self.str_fmt(self.dish_type)}" '
-            f'-D DISH_DEPTH="{self.dish_depth}" '
-            f'-D DISH_TILT="{self.dish_tilt}" '
-            f'-D DISH_TILT_CURVE="{self.str_fmt(self.dish_tilt_curve)}" '
-            f'-D DISH_FN="{self.dish_fn}" '
-            f'-D DISH_CORNER_FN="{self.dish_corner_fn}" '
-            f'-D POLYGON_LAYERS="{self.polygon_layers}" '
-            f'-D POLYGON_LAYER_ROTATION="{self.str_fmt(self.polygon_layer_rotation)}" '
-            f'-D POLYGON_EDGES="{self.polygon_edges}" '
-            f'-D POLYGON_ROTATION="{self.str_fmt(self.polygon_rotation)}" '
-            f'-D CORNER_RADIUS="{self.corner_radius}" '
-            f'-D CORNER_RADIUS_CURVE="{self.str_fmt(self.corner_radius_curve)}" '
-            f'-D STEM_TYPE="{self.str_fmt(self.stem_type)}" '
-            f'-D STEM_TOP_THICKNESS="{self.stem_top_thickness}" '
-            f'-D STEM_INSET="{self.stem_inset}" '
-            f'-D STEM_INSIDE_TOLERANCE="{self.stem_inside_tolerance}" '
-            f'-D STEM_OUTSIDE_TOLERANCE_X="{self.stem_outside_tolerance_x}" '
-            f'-D STEM_OUTSIDE_TOLERANCE_Y="{self.stem_outside_tolerance_y}" '
-            f'-D STEM_SIDE_SUPPORTS="{self.stem_side_supports}" '
-            f'-D STEM_SIDES_WALL_THICKNESS="{self.stem_sides_wall_thickness}" '
-            f'-D STEM_LOCATIONS="{self.stem_locations}" '
-            f'-D STEM_SNAP_FIT="{self.str_fmt(self.stem_snap_fit)}" '
-            f'-D STEM_WALLS_INSET="{self.stem_walls_inset}" '
-            f'-D STEM_WALLS_TOLERANCE="{self.stem_walls_tolerance}" '
-            f'-D HOMING_DOT_LENGTH="{self.homing_dot_length}" '
-            f'-D HOMING_DOT_WIDTH="{self.homing_dot_width}" '
-            f'-D HOMING_DOT_X="{self.homing_dot_x}" '
-            f'-D HOMING_DOT_Y="{self.homing_dot_y}" '
-            f'-D HOMING_DOT_Z="{self.homing_dot_z}" '
-            #f'-D LEGENDS="[\\"{self.legends}\\"]" '
-            f'-D LEGENDS="{self.quote(self.legends)}" ' # (TODO) figure out the correct escape sequence
-            f'-D LEGEND_FONTS="{self.str_fmt(self.fonts)}" '
-            f'-D LEGEND_FONT_SIZES="{self.font_sizes}" '
-            f'-D LEGEND_TRANS="{self.trans}" '
-            f'-D LEGEND_TRANS2="{self.trans2}" '
-            f'-D LEGEND_ROTATION="{self.rotation}" '
-            f'-D LEGEND_ROTATION2="{self.rotation2}" '
-            f'-D LEGEND_SCALE="{self.scale}" '
-            f'-D LEGEND_UNDERSET="{self.underset}" '
-            # NOTE: For some reason I have to duplicate RENDER here for it to work properly:
-            f'-D RENDER="{self.str_fmt(self.render)}" '
-            f"scad\keycap_playground.scad"
-        )
+        for var, value in self.param_dict().items():
+            if var in _VECTOR_VARS:
+                value = json.dumps(value, separators=(",", ":"))
+            else:
+                value = scad_literal(value)
+            args += ["-D", f"{var}={value}"]
+        # NOTE: For some reason I have to duplicate RENDER here for it to work properly:
+        args += ["-D", f"RENDER={scad_literal(self.render)}"]
+        args.append(str(
+            Path(self.keycap_playground_path) / "scad" / "keycap_playground.scad"))
+        cmd = self._cmd_cache = (tuple(args), _join_args(args))
+        return cmd
+
+    async def generate_async(self):
+        """
+        Like `generate()` but runs OpenSCAD via asyncio (using `argv()` so no
+        shell is involved).  Returns `(retcode, output)`.
+        """
+        proc = await asyncio.create_subprocess_exec(*self.argv(),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        output, _ = await proc.communicate()
+        return proc.returncode, output.decode(errors="replace").rstrip("\n")
+
+    def __setattr__(self, name, value):
+        # Changing anything invalidates the cached command line (see __str__)
+        if name != "_cmd_cache":
+            object.__setattr__(self, "_cmd_cache", None)
+        object.__setattr__(self, name, value)
+
+    def __str__(self):
+        """
+        Returns the OpenSCAD command line to use to generate this keycap
+        (quoted for the platform's shell).  Mostly useful for logging; use
+        `argv()` or `generate()` to actually run it.
+
+        .. note::
+
+            The result is cached until an attribute gets assigned.  Modifying
+            a list attribute in place (e.g. `self.trans[0] = [1,2,3]`) *after*
+            calling `str()` won't be noticed; assign a new list instead.
+        """
+        return self._command()[1]
+
+    @classmethod
+    def render_batch(cls, keycaps, out_dir=None):
+        """
+        Renders all the given *keycaps* into *out_dir* (defaults to each
+        keycap's own `output_path`) from a single generated driver .scad file
+        (see `KeycapServer`).  Each OpenSCAD invocation only needs
+        `-D IDX=<n>` instead of ~50 `-D` arguments.  Returns a list of
+        `(name, retcode, output)` tuples.
+
+        .. note::
+
+            OpenSCAD can only export one model per invocation so this still
+            runs OpenSCAD once per keycap.
+        """
+        with KeycapServer(keycaps) as server:
+            return [
+                (kc.name,) + server.render(kc, out_dir=out_dir)
+                for kc in keycaps]
+
+    def generate(self, quiet=False):
+        """
+        Renders this keycap.  Returns `(retcode, output)` just like
+        `getstatusoutput()`.  If *quiet* is `True` OpenSCAD's output is
+        discarded unless the render fails.
+        """
+        return _run_one(self.argv(), quiet=quiet)
+
+    def generate_streaming(self, on_line=print):
+        """
+        Like `generate()` but passes each line of OpenSCAD's output to
+        *on_line* as soon as it's printed instead of collecting it all.
+        Returns just the retcode.  Handy for showing progress on long renders.
+        """
+        return _stream_one(self.argv(), on_line)
+
+    def cached_render(self, cache_dir=keycap_cache.DEFAULT_CACHE_DIR,
+            on_line=None, refresh=False, quiet=False):
+        """
+        Like `generate()` but skips OpenSCAD entirely if an identical keycap
+        has already been rendered into *cache_dir* (see
+        `keycap_cache.cached_render()` for the other arguments).
+        """
+        return keycap_cache.cached_render(self, cache_dir=cache_dir,
+            on_line=on_line, refresh=refresh, quiet=quiet)
+
+    def render_via(self, server):
+        """
+        Renders this keycap using the given `KeycapServer`.  Returns
+        `(retcode, output)` just like `getstatusoutput()`.
+        """
+        return server.render(self)
+
+    @classmethod
+    def spawn(cls, **overrides):
+        """
+        Makes lots of similar keycaps quickly:  Instead of running
+        `__init__()` (and all its assignments) every time, a template instance
+        of *cls* is made once (with no arguments, cached on the class) and
+        each call just copies it and sets the *overrides* as attributes.
+        Example::
+
+            blanks = [KeycapBase.spawn(name=f"blank{i}") for i in range(10)]
+
+        .. note::
+
+            This is *not* the same as `cls(**overrides)` for classes whose
+            `__init__()` derives things from its arguments; that logic only
+            ever ran for the template.  For example, a name prefix built from
+            the legends won't get added (`name` just defaults to the first
+            legend) and fields that depend on another argument (e.g. a
+            `key_rotation` picked based on `dish_invert`) keep the template's
+            values.  Use `cls(...)` for those or pass every derived attribute
+            in *overrides* yourself.  Also, extra constructor arguments
+            (e.g. `homing_dot`) aren't supported and list attributes are
+            shared with the template (assign new lists instead of modifying
+            them in place).
+        """
+        template = cls.__dict__.get("_template")
+        if template is None:
+            template = cls()
+            cls._template = template
+        inst = copy.copy(template)
+        if "name" not in overrides and overrides.get("legends"):
+            if overrides["legends"][0]:
+                inst.name = overrides["legends"][0]
+        for k, v in overrides.items():
+            setattr(inst, k, v)
+        return inst
 
     def postinit(self, **kwargs):
         """
-        Override anything passed in via kwargs
+        Override anything passed in via kwargs.  Unknown names raise
+        `AttributeError` unless the subclass has a `__dict__` (see the note
+        about `__slots__` above).
         """
         #print(f"postinit kwargs: {kwargs}")
         for k, v in kwargs.items():
-            #print(f"Updating: {k}: {v}")
-            self.__dict__.update({k: v})
+            setattr(self, k, v)
+
+
+def _run_one(args, quiet=False):
+    """
+    Runs the given command (a list of arguments; no shell) and returns
+    `(retcode, output)` just like `getstatusoutput()` would.  If *quiet* is
+    `True` the output goes to a temporary file that only gets read if the
+    command failed (otherwise *output* is empty).
+    """
+    if quiet:
+        # OpenSCAD logs to stderr so /dev/null'ing stdout alone isn't enough.
+        # Spooling to a file means successful renders never get read at all.
+        with tempfile.TemporaryFile() as log:
+            try:
+                retcode = subprocess.run(args, stdin=subprocess.DEVNULL,
+                    stdout=log, stderr=subprocess.STDOUT).returncode
+            except OSError as e:
+                return 127, str(e)
+            if not retcode:
+                return 0, ""
+            log.seek(0)
+            output = log.read().decode(errors="replace")
+        return retcode, output.rstrip("\n")
+    try: # stderr goes into the same pipe so messages keep their order
+        result = subprocess.run(args, stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, errors="replace")
+    except OSError as e: # e.g. OpenSCAD isn't installed where we were told
+        return 127, str(e)
+    return result.returncode, result.stdout.rstrip("\n")
+
+def _stream_one(args, on_line):
+    """
+    Runs the given command (a list of arguments; no shell) calling
+    *on_line* with each line of output (sans trailing newline) as it
+    arrives.  Returns the retcode.
+    """
+    try:
+        proc = subprocess.Popen(args,
+            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, text=True, errors="replace", bufsize=1)
+    except OSError as e:
+        on_line(str(e))
+        return 127
+    with proc:
+        for line in proc.stdout:
+            on_line(line.rstrip("\n"))
+    return proc.wait()
+
+def render_all(keycaps, workers=None):
+    """
+    Renders all the given *keycaps* in parallel using up to *workers*
+    OpenSCAD processes at a time (defaults to `os.cpu_count()`).  Returns a
+    list of `(retcode, output)` tuples in the same order as *keycaps*.
+
+    .. note::
+
+        OpenSCAD is single-threaded so this is the only way to put more than
+        one core to work.  Memory usage scales with *workers* times however
+        much RAM a single OpenSCAD render needs (which can be a lot for
+        complex keycaps).
+    """
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_run_one, [kc.argv() for kc in keycaps]))
+
+async def render_many(keycaps, concurrency=None):
+    """
+    The asyncio equivalent of `render_all()`:  Renders all the given *keycaps*
+    with up to *concurrency* OpenSCAD processes running at a time (defaults to
+    `os.cpu_count()`).  Returns a list of `(retcode, output)` tuples in the
+    same order as *keycaps*.  Example::
+
+        results = asyncio.run(render_many([tilde, ...]))
+    """
+    semaphore = asyncio.Semaphore(concurrency or os.cpu_count() or 1)
+    async def _render(keycap):
+        async with semaphore:
+            return await keycap.generate_async()
+    return await asyncio.gather(*(_render(kc) for kc in keycaps))
+
+class KeycapServer(object):
+    """
+    Keeps a single driver .scad file around for an entire render session.  The
+    driver holds the parameters of every keycap it has seen in one vector and
+    `include`s the Keycap Playground, overriding its globals with
+    `_KEYCAPS[IDX]`.  Example::
+
+        with KeycapServer() as server:
+            retcode, output = server.render(tilde)
+
+    .. note::
+
+        OpenSCAD has no way to keep a process around and feed it models over
+        stdin so each `render()` still launches OpenSCAD; what's shared is the
+        driver file (no more giant `-D` command lines).
+    """
+    def __init__(self, keycaps=()):
+        self.keycaps = list(keycaps)
+        self.driver = None
+        self._tmpdir = None
+        self._written = 0 # Number of keycaps in the driver on disk
+
+    def __enter__(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.driver = Path(self._tmpdir.name) / "keycaps.scad"
+        return self
+
+    def __exit__(self, *exc_info):
+        self._tmpdir.cleanup()
+        self._tmpdir = self.driver = None
+        self._written = 0
+
+    def write_driver(self):
+        """
+        (Re)writes the driver .scad file with all the keycaps we know about.
+        """
+        first = self.keycaps[0]
+        playground = (Path(first.keycap_playground_path).resolve()
+                      / "scad" / "keycap_playground.scad")
+        variables = list(first.param_dict().keys())
+        bundles = ",\n".join(
+            "    " + json.dumps(
+                list(kc.param_dict().values()), ensure_ascii=False)
+            for kc in self.keycaps)
+        # Assignments after the include override the playground's defaults
+        # (OpenSCAD evaluates them where the original assignment was made):
+        overrides = "\n".join(
+            f"{var} = _KEYCAPS[IDX][{i}];" for i, var in enumerate(variables))
+        self.driver.write_text(
+            "// Generated by keycap.py (KeycapServer)\n"
+            "IDX = 0;\n"
+            f"_KEYCAPS = [\n{bundles}\n];\n"
+            f"include <{playground.as_posix()}>\n"
+            f"{overrides}\n", encoding="utf-8")
+        self._written = len(self.keycaps)
+
+    def argv(self, keycap, out_dir=None):
+        """
+        Returns the OpenSCAD command (a list of arguments) that renders
+        *keycap* to `<out_dir>/<keycap.name>.stl` from the driver (*out_dir*
+        defaults to `keycap.output_path`), adding *keycap* to the driver
+        first if need be.
+
+        .. note::
+
+            A keycap's parameters are captured the first time it gets written
+            to the driver; changing them afterwards (other than `name` or
+            `output_path`) won't be picked up by this server.
+        """
+        for idx, known in enumerate(self.keycaps):
+            if known is keycap:
+                break
+        else:
+            self.keycaps.append(keycap)
+            idx = len(self.keycaps) - 1
+        if idx >= self._written:
+            self.write_driver()
+        if out_dir is None:
+            out_dir = keycap.output_path
+        out = Path(out_dir) / f"{keycap.name}.stl"
+        return ([_openscad_exe(keycap.openscad_path)] + keycap.openscad_flags()
+            + ["-o", str(out), "-D", f"IDX={idx}", str(self.driver)])
+
+    def _fresh_argv(self, keycap, out_dir=None):
+        """
+        Like `argv()` but also removes any existing output file first.  It
+        might be a hardlink into a `keycap_cache` directory from an earlier
+        cached render and OpenSCAD would write right through it.
+        """
+        args = self.argv(keycap, out_dir=out_dir)
+        Path(args[args.index("-o") + 1]).unlink(missing_ok=True)
+        return args
+
+    def render(self, keycap, out_dir=None, quiet=False):
+        """
+        Renders *keycap* to `<out_dir>/<keycap.name>.stl` (*out_dir* defaults
+        to `keycap.output_path`).  Returns `(retcode, output)`.  *quiet* works
+        the same as in `Keycap.generate()`.  See the note in `argv()`.
+        """
+        return _run_one(
+            self._fresh_argv(keycap, out_dir=out_dir), quiet=quiet)
+
+    def render_all(self, keycaps=None, workers=None, quiet=False):
+        """
+        Like the module-level `render_all()` (up to *workers* OpenSCAD
+        processes at a time) but every render comes from this server's driver.
+        *keycaps* defaults to all the keycaps the server was given.  Returns a
+        list of `(retcode, output)` tuples in the same order as *keycaps*.
+        *quiet* works the same as in `Keycap.generate()`.
+        """
+        if keycaps is None:
+            keycaps = self.keycaps
+        commands = [self._fresh_argv(kc) for kc in keycaps]
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(
+                functools.partial(_run_one, quiet=quiet), commands))
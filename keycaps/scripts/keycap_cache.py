@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+"""
+A content-addressed cache of rendered keycaps.  Lots of keycaps in a layout
+end up with identical parameters (blanks, repeated modifiers, etc) so there's
+no point making OpenSCAD render them more than once.  Usage::
+
+    from keycap_cache import cached_render
+    retcode, output = cached_render(tilde)
+
+...or via `tilde.cached_render()`.
+"""
+
+import os
+import shutil
+import hashlib
+import functools
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(".keycap_cache")
+
+def cache_key(keycap):
+    """
+    Returns a hex digest that uniquely identifies the STL *keycap* would
+    render to: A hash of its OpenSCAD command line minus the output path (so
+    the same key with a different name/destination still counts) plus the
+    modification times of the .scad files it uses (so editing the Keycap
+    Playground invalidates everything; see `_scad_stamp()`).
+    """
+    args = list(keycap.argv())
+    if "-o" in args:
+        del args[args.index("-o") + 1]
+    args.append(_scad_stamp(str(Path(args[-1]).parent)))
+    return hashlib.blake2b(
+        "\0".join(args).encode(), digest_size=20).hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def _scad_stamp(scad_dir):
+    """
+    Returns a string that changes whenever any .scad file in *scad_dir*
+    (i.e. anything the playground might `use <...>`) gets modified.
+
+    .. note::
+
+        This is only worked out once per directory per process (otherwise
+        every `cache_key()` call would cost a scandir() and a stat() per
+        .scad file).  Call `_scad_stamp.cache_clear()` if the .scad files
+        might've changed since.
+    """
+    try:
+        entries = sorted(
+            (e.name, e.stat().st_mtime_ns)
+            for e in os.scandir(scad_dir)
+            if e.name.endswith(".scad"))
+    except OSError: # Missing directory; OpenSCAD will complain about it
+        return ""
+    return ",".join(f"{name}:{mtime}" for name, mtime in entries)
+
+def _link(src, dst):
+    """
+    Hardlinks *src* to *dst* (replacing *dst* if it exists), falling back to
+    a copy when hardlinks aren't possible (e.g. across filesystems).  Raises
+    `FileNotFoundError` if *src* doesn't exist.
+    """
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        shutil.copy2(src, dst)
+
+def cached_render(keycap, cache_dir=DEFAULT_CACHE_DIR,
+        on_line=None, refresh=False, quiet=False):
+    """
+    Renders *keycap* unless an identical keycap has already been rendered in
+    which case the cached STL is hardlinked into place as
+    `{output_path}/{name}.stl`.  Returns `(retcode, output)` just like
+    `Keycap.generate()`.  If *on_line* is given output is streamed to it
+    instead (see `Keycap.generate_streaming()`) and the returned output is
+    empty.  If *refresh* is `True` the keycap is always re-rendered (and the
+    cache updated).  *quiet* is passed on to `Keycap.generate()` (it's
+    ignored if *on_line* is given).
+
+    .. note::
+
+        Since outputs are hardlinks to the cache entries you should delete an
+        STL (rather than let OpenSCAD overwrite it) before re-rendering it
+        without the cache or the cached copy will get clobbered too.
+    """
+    cache_dir = Path(cache_dir)
+    cached = cache_dir / f"{cache_key(keycap)}.stl"
+    target = Path(keycap.output_path) / f"{keycap.name}.stl"
+    if not refresh:
+        # Just try it; checking first would cost a stat() and could race
+        try:
+            _link(cached, target)
+        except FileNotFoundError:
+            pass # Not cached (yet)
+        else:
+            msg = f"Using cached render: {cached}"
+            if on_line:
+                on_line(msg)
+                return 0, ""
+            return 0, msg
+    # Don't let OpenSCAD write through an old hardlink into the cache:
+    target.unlink(missing_ok=True)
+    if on_line:
+        retcode, output = keycap.generate_streaming(on_line), ""
+    else:
+        retcode, output = keycap.generate(quiet=quiet)
+    if retcode == 0:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            _link(target, cached)
+        except FileNotFoundError:
+            pass # OpenSCAD "succeeded" without writing anything
+    return retcode, output
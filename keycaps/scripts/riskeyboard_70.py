@@ -11,24 +11,75 @@ to use this script is from within the `keycap_playground` directory.
 
 # stdlib imports
 import os, sys
+import shutil
 import json
+import functools
 import argparse
-from copy import deepcopy
-from subprocess import getstatusoutput
+from copy import copy
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 # 3rd party stuff
 from colorama import Fore, Back, Style
 from colorama import init as color_init
 color_init()
+HDR, END = Style.BRIGHT, Style.RESET_ALL # Wrapped around status messages
 # Our own stuff
-from keycap import Keycap
+from keycap import Keycap, KeycapServer, openscad_caps, seed_openscad_caps
+from keycap_cache import cache_key
 
 KEY_UNIT = 14.5 # Square that makes up the entire space of a key
 BETWEENSPACE = 0.8 # Space between keycaps
+# Fonts we use (one shared string object each instead of a copy per keycap)
+FONT_GOTHAM_BOLD = "Gotham Rounded:style=Bold"
+FONT_ARIAL_BLACK = "Arial Black:style=Regular"
+FONT_AHARONI = "Aharoni"
+FONT_HACK = "Hack"
+FONT_AWESOME = "FontAwesome"
+
+def _copy_kwargs(kwargs):
+    """
+    Returns a copy of *kwargs* that's safe to pass to `postinit()` after
+    modifying things like `self.trans[0]` in place.  A shallow copy of each
+    list is enough (and much cheaper than `deepcopy()`) since we only ever
+    replace their elements.
+    """
+    return {k: (v.copy() if isinstance(v, list) else v)
+            for k, v in kwargs.items()}
 
 class riskeyboard70_base(Keycap):
     """
     Base keycap definitions for Gotham Rounded
     """
+    __slots__ = ()
+    # These defaults are tuples so every instance can share them.  Subclasses
+    # that need to change an element in place should replace the whole thing
+    # with a list first (e.g. `self.fonts = list(self.fonts)`).
+    # Because we do strange things we need legends bigger on the Z
+    _DEFAULT_SCALE = (
+        (1,1,1),
+        (1,1.75,3), # For the pipe to make it taller/more of a divider
+        (1,1,3),
+    )
+    _DEFAULT_FONTS = (
+        #"Gotham Rounded:style=Bold",
+        #"Gotham Rounded:style=Bold",
+        FONT_ARIAL_BLACK,
+    )
+    _DEFAULT_FONT_SIZES = (
+        5.5,
+        4, # Gotham Rounded second legend (top right)
+        4, # Front legend
+    )
+    _DEFAULT_TRANS = (
+        (-3,-2.6,2), # Lower left corner Gotham Rounded
+        (3.5,3,1), # Top right Gotham Rounded
+        (0.15,-3,2), # Front legend
+    )
+    _DEFAULT_ROTATION = (
+        (0,0,0),
+        (0,-20,0),
+        (68,0,0),
+    )
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.key_profile = "riskeycap"
@@ -45,32 +96,11 @@ class riskeyboard70_base(Keycap):
         self.stem_side_supports = [0,0,0,0]
         self.stem_locations = [[0,0,0]]
         self.stem_sides_wall_thickness = 0.5; # Thick (good sound/feel)
-        # Because we do strange things we need legends bigger on the Z
-        self.scale = [
-            [1,1,1],
-            [1,1.75,3], # For the pipe to make it taller/more of a divider
-            [1,1,3],
-        ]
-        self.fonts = [
-            #"Gotham Rounded:style=Bold",
-            #"Gotham Rounded:style=Bold",
-            "Arial Black:style=Regular",
-        ]
-        self.font_sizes = [
-            5.5,
-            4, # Gotham Rounded second legend (top right)
-            4, # Front legend
-        ]
-        self.trans = [
-            [-3,-2.6,2], # Lower left corner Gotham Rounded
-            [3.5,3,1], # Top right Gotham Rounded
-            [0.15,-3,2], # Front legend
-        ]
-        self.rotation = [
-            [0,0,0],
-            [0,-20,0],
-            [68,0,0],
-        ]
+        self.scale = self._DEFAULT_SCALE
+        self.fonts = self._DEFAULT_FONTS
+        self.font_sizes = self._DEFAULT_FONT_SIZES
+        self.trans = self._DEFAULT_TRANS
+        self.rotation = self._DEFAULT_ROTATION
         self.postinit(**kwargs)
 
 # KEY_ROTATION = [0,107.8,90]; // GEM profile rotation 1.5U
@@ -79,6 +109,7 @@ class riskeyboard70_alphas(riskeyboard70_base):
     """
     Tilde needs some changes because by default it's too small
     """
+    __slots__ = ()
     def __init__(self, homing_dot=False, **kwargs):
         super().__init__(**kwargs)
         self.font_sizes = [
@@ -99,6 +130,7 @@ class riskeyboard70_FKey(riskeyboard70_alphas):
     """
     F keys are too large, need to scale smaller
     """
+    __slots__ = ()
     def __init__(self, homing_dot=False, **kwargs):
         super().__init__(**kwargs)
         self.font_sizes = [
@@ -112,6 +144,7 @@ class riskeyboard70_home(riskeyboard70_alphas):
     """
     F keys are too large, need to scale smaller
     """
+    __slots__ = ()
     def __init__(self, homing_dot=False, **kwargs):
         super().__init__(**kwargs)
         self.font_sizes = [
@@ -122,7 +155,7 @@ class riskeyboard70_home(riskeyboard70_alphas):
         self.fonts = [
             #"Gotham Rounded:style=Bold",
             #"Gotham Rounded:style=Bold",
-            "Arial Black:style=Regular",
+            FONT_ARIAL_BLACK,
         ]
         self.postinit(**kwargs)
 
@@ -130,13 +163,14 @@ class riskeyboard70_numrow(riskeyboard70_base):
     """
     Number row numbers are slightly different
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.fonts = [
-            "Gotham Rounded:style=Bold", # Main char
-            "Gotham Rounded:style=Bold", # Pipe character
-            "Gotham Rounded:style=Bold", # Symbol
-            "Arial Black:style=Regular", # F-key
+            FONT_GOTHAM_BOLD, # Main char
+            FONT_GOTHAM_BOLD, # Pipe character
+            FONT_GOTHAM_BOLD, # Symbol
+            FONT_ARIAL_BLACK, # F-key
         ]
         self.font_sizes = [
             4.5, # Regular character
@@ -168,6 +202,7 @@ class riskeyboard70_tilde(riskeyboard70_numrow):
     """
     Tilde needs some changes because by default it's too small
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.font_sizes[0] = 6.5 # ` symbol
@@ -179,9 +214,10 @@ class riskeyboard70_2(riskeyboard70_numrow):
     """
     2 needs some changes based on the @ symbol
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.fonts[2] = "Aharoni"
+        self.fonts[2] = FONT_AHARONI
         self.font_sizes[2] = 4.5 # @ symbol (Aharoni)
         self.trans[2] = [5.4,0,1]
 
@@ -189,6 +225,7 @@ class riskeyboard70_3(riskeyboard70_numrow):
     """
     3 needs some changes based on the # symbol (slightly too big)
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.font_sizes[2] = 4 # # symbol (Gotham Rounded)
@@ -198,6 +235,7 @@ class riskeyboard70_5(riskeyboard70_numrow):
     """
     5 needs some changes based on the % symbol (too big, too close to bar)
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.font_sizes[2] = 3.75 # % symbol
@@ -207,6 +245,7 @@ class riskeyboard70_7(riskeyboard70_numrow):
     """
     7 needs some changes based on the & symbol (it's too big)
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.font_sizes[2] = 3.85 # & symbol
@@ -216,6 +255,7 @@ class riskeyboard70_8(riskeyboard70_numrow):
     """
     8 needs some changes based on the tiny * symbol
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.font_sizes[2] = 7.5 # * symbol (Gotham Rounded)
@@ -225,6 +265,7 @@ class riskeyboard70_equal(riskeyboard70_numrow):
     """
     = needs some changes because it and the + are a bit off center
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.trans[0] = [-0.3,-0.5,0] # = sign adjustments
@@ -234,6 +275,7 @@ class riskeyboard70_dash(riskeyboard70_numrow):
     """
     The dash (-) is fine but the underscore (_) needs minor repositioning.
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.trans[2] = [5.2,-1,1] # _ needs to go down and to the right a bit
@@ -243,12 +285,13 @@ class riskeyboard70_double_legends(riskeyboard70_base):
     """
     For regular keys that have two legends... ,./;'[]
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.fonts = [
-            "Gotham Rounded:style=Bold", # Main legend
-            "Gotham Rounded:style=Bold", # Pipe character
-            "Gotham Rounded:style=Bold", # Second legend
+            FONT_GOTHAM_BOLD, # Main legend
+            FONT_GOTHAM_BOLD, # Pipe character
+            FONT_GOTHAM_BOLD, # Second legend
         ]
         self.font_sizes = [
             4.5, # Regular Gotham Rounded character
@@ -276,6 +319,7 @@ class riskeyboard70_prtsc(riskeyboard70_double_legends):
     """
     Rescale for minus key
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.font_sizes = [
@@ -289,6 +333,7 @@ class riskeyboard70_pg_ptr(riskeyboard70_double_legends):
     """
     Rescale for minus key
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.font_sizes = [
@@ -296,13 +341,14 @@ class riskeyboard70_pg_ptr(riskeyboard70_double_legends):
             3,
             4.5,
         ]
-        self.fonts[2] = "Hack"
+        self.fonts[2] = FONT_HACK
         self.postinit(**kwargs)
 
 class riskeyboard70_minus(riskeyboard70_double_legends):
     """
     Rescale for minus key
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.scale = [
@@ -316,6 +362,7 @@ class riskeyboard70_tick(riskeyboard70_double_legends):
     """
     Rescale for tick key
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.trans = [
@@ -334,6 +381,7 @@ class riskeyboard70_gt_lt(riskeyboard70_double_legends):
     """
     The greater than (>) and less than (<) signs need to be adjusted down a bit
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.trans[0] = [-0.3,-0.1,0] # , and . are the tiniest bit too high
@@ -343,6 +391,7 @@ class riskeyboard70_brackets(riskeyboard70_double_legends):
     """
     The curly braces `{}` needs to be moved to the right a smidge
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.trans[2] = [5.2,0,1] # Just a smidge to the right
@@ -352,6 +401,7 @@ class riskeyboard70_semicolon(riskeyboard70_double_legends):
     The semicolon ends up being slightly higher than the colon but it looks
     better if the top dot in both is aligned.
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.trans[0] = [0.2,-0.4,0]
@@ -361,9 +411,10 @@ class riskeyboard70_1_U_text(riskeyboard70_alphas):
     """
     Ctrl, Del, and Ins need to be downsized and moved a smidge.
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
+        kwargs_copy = _copy_kwargs(kwargs)
         self.font_sizes[0] = 4
         self.trans[0] = [2.5,0,0]
         self.postinit(**kwargs_copy)
@@ -372,9 +423,11 @@ class riskeyboard70_arrows(riskeyboard70_alphas):
     """
     Arrow symbols (◀▶▲▼) needs a different font (Hack)
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.fonts[0] = "Hack"
+        self.fonts = list(self.fonts) # Copy-on-write (it's a shared tuple)
+        self.fonts[0] = FONT_HACK
         #self.fonts[2] = "FontAwesome" # For next/prev track icons
         #self.font_sizes[2] = 4 # FontAwesome prev/next icons
         #self.trans[2] = [0,-2,2] # Ditto
@@ -383,9 +436,11 @@ class riskeyboard70_fontawesome(riskeyboard70_alphas):
     """
     For regular centered FontAwesome icon keycaps.
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.fonts[0] = "FontAwesome"
+        self.fonts = list(self.fonts) # Copy-on-write (it's a shared tuple)
+        self.fonts[0] = FONT_AWESOME
         self.font_sizes[0] = 5
         self.trans[0] = [2.6,0.3,0]
 
@@ -393,43 +448,49 @@ class riskeyboard70_1_25U(riskeyboard70_alphas):
     """
     The base for all 1.25U keycaps.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "1.25U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
+        kwargs_copy = _copy_kwargs(kwargs) # Because self.trans[0] updates in place
         self.key_length = KEY_UNIT*1.25-BETWEENSPACE
 #        self.key_rotation = [0,108.55,90]
         self.trans[0] = [0.5,0,0]
         self.postinit(**kwargs_copy)
-        if not self.name.startswith('1.25U_'):
-            self.name = f"1.25U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_1_4U(riskeyboard70_alphas):
     """
     The base for all 1.4U keycaps.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "1.4U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
+        kwargs_copy = _copy_kwargs(kwargs) # Because self.trans[0] updates in place
         self.key_length = (KEY_UNIT-2)*1.4+2-BETWEENSPACE
         self.font_sizes[0] = 4
         self.trans[0] = [0,0,0]
         self.postinit(**kwargs_copy)
-        if not self.name.startswith('1.4U_'):
-            self.name = f"1.4U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_1_6U(riskeyboard70_alphas):
     """
     The base for all 1.6U keycaps.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "1.6U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs) # Because self.trans[0] updates in place
+        kwargs_copy = _copy_kwargs(kwargs) # Because self.trans[0] updates in place
         self.key_length = (KEY_UNIT-2)*1.6+2-BETWEENSPACE
         self.font_sizes[0] = 4
         self.trans[0] = [0,0,0]
         self.postinit(**kwargs_copy)
-        if not self.name.startswith('1.6U_'):
-            self.name = f"1.6U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_1_5U(riskeyboard70_double_legends):
     """
@@ -437,19 +498,22 @@ class riskeyboard70_1_5U(riskeyboard70_double_legends):
 
     .. note:: Uses riskeyboard70_double_legends because of the \\| key.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "1.5U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.key_length = KEY_UNIT*1.5-BETWEENSPACE
         #self.key_rotation = [0,107.825,90]
         self.trans[0] = [1.5, 0, 0]
         self.postinit(**kwargs)
-        if not self.name.startswith('1.5U_'):
-            self.name = f"1.5U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_bslash(riskeyboard70_double_legends):
     """
     Backslash key needs a very minor adjustment to the backslash.
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.key_length = (KEY_UNIT-2)*2+2-BETWEENSPACE
@@ -459,6 +523,7 @@ class riskeyboard70_tab(riskeyboard70_1_5U):
     """
     "Tab" needs to be centered.
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.font_sizes[0] = 4.5 # Regular Gotham Rounded
@@ -468,18 +533,22 @@ class riskeyboard70_1_75U(riskeyboard70_alphas):
     """
     The base for all 1.75U keycaps.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "1.75U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.key_length = KEY_UNIT*1.75-BETWEENSPACE
         self.key_rotation = [0,107.85,90]
         self.postinit(**kwargs)
-        if not self.name.startswith('1.75U_'):
-            self.name = f"1.75U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_2U(riskeyboard70_alphas):
     """
     The base for all 2U keycaps.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "2U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.key_length = (KEY_UNIT-2)*2+2-BETWEENSPACE
@@ -488,16 +557,18 @@ class riskeyboard70_2U(riskeyboard70_alphas):
         if "dish_invert" in kwargs and kwargs["dish_invert"]:
             self.key_rotation = [0,111.88,90] # Spacebars are different
         self.postinit(**kwargs)
-        if not self.name.startswith('2U_'):
-            self.name = f"2U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_2_25U(riskeyboard70_alphas):
     """
     The base for all 2.25U keycaps.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "2.25U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
+        kwargs_copy = _copy_kwargs(kwargs)
         self.key_length = KEY_UNIT*2.25-BETWEENSPACE
         self.key_rotation = [0,107.85,90] # Same as 1.75U and 2U
         if "dish_invert" in kwargs and kwargs["dish_invert"]:
@@ -506,16 +577,18 @@ class riskeyboard70_2_25U(riskeyboard70_alphas):
         self.trans[0] = [3.1,0.2,0]
         self.font_sizes[0] = 4
         self.postinit(**kwargs_copy)
-        if not self.name.startswith('2.25U_'):
-            self.name = f"2.25U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_2_5U(riskeyboard70_alphas):
     """
     The base for all 2.5U keycaps.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "2.5U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
+        kwargs_copy = _copy_kwargs(kwargs)
         self.key_length = KEY_UNIT*2.5-BETWEENSPACE
         self.key_rotation = [0,107.85,90] # Same as 1.75U and 2U
         if "dish_invert" in kwargs and kwargs["dish_invert"]:
@@ -524,16 +597,18 @@ class riskeyboard70_2_5U(riskeyboard70_alphas):
         self.trans[0] = [3.1,0.2,0]
         self.font_sizes[0] = 4
         self.postinit(**kwargs_copy)
-        if not self.name.startswith('2.5U_'):
-            self.name = f"2.5U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_2_6U(riskeyboard70_alphas):
     """
     The base for all 2.6U keycaps.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "2.6U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
+        kwargs_copy = _copy_kwargs(kwargs)
         self.key_length = (KEY_UNIT-2)*2.6+2-BETWEENSPACE
         self.key_rotation = [0,107.85,90] # Same as 1.75U and 2U
         if "dish_invert" in kwargs and kwargs["dish_invert"]:
@@ -541,35 +616,38 @@ class riskeyboard70_2_6U(riskeyboard70_alphas):
         self.stem_locations = [[0,0,0], [11,0,0], [-12,0,0]]
         self.font_sizes[0] = 4
         self.postinit(**kwargs_copy)
-        if not self.name.startswith('2.6U_'):
-            self.name = f"2.6U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_enter(riskeyboard70_2_6U):
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
+        kwargs_copy = _copy_kwargs(kwargs)
         self.stem_locations = [[0,0,0], [11.5,0,0], [-12,0,0]]
         self.postinit(**kwargs_copy)
-        if not self.name.startswith('2.6U_'):
-            self.name = f"2.6U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_backspace(riskeyboard70_2_6U):
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
+        kwargs_copy = _copy_kwargs(kwargs)
         self.font_sizes[0] = 3
         self.stem_locations = [[0,0,0], [11.5,0,0], [-12,0,0]]
         self.postinit(**kwargs_copy)
-        if not self.name.startswith('2.6U_'):
-            self.name = f"2.6U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_leftSpace(riskeyboard70_alphas):
     """
     Left space bar
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
+        kwargs_copy = _copy_kwargs(kwargs)
         self.key_length = 49+2-BETWEENSPACE
         self.key_rotation = [0,107.85,90] # Same as 1.75U and 2U
         if "dish_invert" in kwargs and kwargs["dish_invert"]:
@@ -581,9 +659,10 @@ class riskeyboard70_rightSpace(riskeyboard70_alphas):
     """
     Left space bar
     """
+    __slots__ = ()
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
+        kwargs_copy = _copy_kwargs(kwargs)
         self.key_length = 51+2-BETWEENSPACE
         self.key_rotation = [0,107.85,90] # Same as 1.75U and 2U
         if "dish_invert" in kwargs and kwargs["dish_invert"]:
@@ -595,9 +674,11 @@ class riskeyboard70_2_75U(riskeyboard70_alphas):
     """
     The base for all 2.75U keycaps.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "2.75U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
+        kwargs_copy = _copy_kwargs(kwargs)
         self.key_length = KEY_UNIT*2.75-BETWEENSPACE
         self.key_rotation = [0,107.85,90] # Same as 1.75U and 2U
         if "dish_invert" in kwargs and kwargs["dish_invert"]:
@@ -606,16 +687,18 @@ class riskeyboard70_2_75U(riskeyboard70_alphas):
         self.trans[0] = [3.1,0.2,0]
         self.font_sizes[0] = 4
         self.postinit(**kwargs_copy)
-        if not self.name.startswith('2.75U_'):
-            self.name = f"2.75U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_6_25U(riskeyboard70_alphas):
     """
     The base for all 6.25U keycaps.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "6.25U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
+        kwargs_copy = _copy_kwargs(kwargs)
         self.key_length = KEY_UNIT*6.25-BETWEENSPACE
         self.key_rotation = [0,107.85,90] # Same as 1.75U and 2U
         if "dish_invert" in kwargs and kwargs["dish_invert"]:
@@ -624,16 +707,18 @@ class riskeyboard70_6_25U(riskeyboard70_alphas):
         self.trans[0] = [3.1,0.2,0]
         self.font_sizes[0] = 4
         self.postinit(**kwargs_copy)
-        if not self.name.startswith('6.25U_'):
-            self.name = f"6.25U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
 
 class riskeyboard70_7U(riskeyboard70_alphas):
     """
     The base for all 7U keycaps.
     """
+    __slots__ = ()
+    _SIZE_PREFIX = "7U_"
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        kwargs_copy = deepcopy(kwargs)
+        kwargs_copy = _copy_kwargs(kwargs)
         self.key_length = KEY_UNIT*7-BETWEENSPACE
         self.key_rotation = [0,107.85,90] # Same as 1.75U and 2U
         if "dish_invert" in kwargs and kwargs["dish_invert"]:
@@ -642,8 +727,8 @@ class riskeyboard70_7U(riskeyboard70_alphas):
         self.trans[0] = [3.1,0.2,0]
         self.font_sizes[0] = 4
         self.postinit(**kwargs_copy)
-        if not self.name.startswith('7U_'):
-            self.name = f"7U_{self.name}"
+        if not self.name.startswith(self._SIZE_PREFIX):
+            self.name = self._SIZE_PREFIX + self.name
     '''
     riskeyboard70_alphas(legends=["A"]),
     riskeyboard70_alphas(legends=["B"]),
@@ -677,83 +762,195 @@ class riskeyboard70_7U(riskeyboard70_alphas):
     riskeyboard70_double_legends(name="quote", legends=["'", "", '\"']),
     riskeyboard70_double_legends(name="slash", legends=["/", "", "?"]),
     '''
-KEYCAPS = [
-    # 1U keys
-    #riskeyboard70_double_legends(name="backslash", legends=["\\", "", "|"]),
-    #riskeyboard70_double_legends(name="gt", legends=[".", "", ">?"]),
-    #riskeyboard70_double_legends(name="lt", legends=[",", "", "<?"]),
-    riskeyboard70_alphas(name="blank", legends=[""]),
-    riskeyboard70_alphas(legends=["fn"]),
-    riskeyboard70_FKey(legends=["F1"]),
-    riskeyboard70_FKey(legends=["F2"]),
-    riskeyboard70_FKey(legends=["F3"]),
-    riskeyboard70_FKey(legends=["F4"]),
-    riskeyboard70_FKey(legends=["F5"]),
-    riskeyboard70_FKey(legends=["F6"]),
-    riskeyboard70_FKey(legends=["F7"]),
-    riskeyboard70_FKey(legends=["F8"]),
-    riskeyboard70_FKey(legends=["F9"]),
-    riskeyboard70_FKey(legends=["F10"]),
-    riskeyboard70_FKey(legends=["F11"]),
-    riskeyboard70_FKey(legends=["F12"]),
-    riskeyboard70_FKey(legends=["esc"]),
-    riskeyboard70_prtsc(name="prt", legends=["prt", "", "sc"]),
-    riskeyboard70_FKey(legends=["ins"]),
-    riskeyboard70_FKey(legends=["del"]),
-    riskeyboard70_home(name="home", legends=["\\u2302"]), # ⌂
-    riskeyboard70_FKey(legends=["end"]),
-    riskeyboard70_pg_ptr(name="pup", legends=["pg", "", '\\u25B2']), # ▲
-    riskeyboard70_pg_ptr(name="pdn", legends=["pg", "", '\\u25BC']), # ▼
-
-    riskeyboard70_double_legends(name="1", legends=["1", "", '!']),
-    riskeyboard70_double_legends(name="2", legends=["2", "", '@']),
-    riskeyboard70_double_legends(name="3", legends=["3", "", '#']),
-    riskeyboard70_double_legends(name="4", legends=["4", "", '$']),
-    riskeyboard70_double_legends(name="5", legends=["5", "", '%']),
-    # follow two symbols were modified to run through powershell. ^^ escapes ^, "&" allows special character &
-    riskeyboard70_double_legends(name="6", legends=["6", "", '^^']),
-    riskeyboard70_double_legends(name="7", legends=["7", "", '"&"']),
-    riskeyboard70_double_legends(name="8", legends=["8", "", '*']),
-    riskeyboard70_double_legends(name="9", legends=["9", "", '(']),
-    riskeyboard70_double_legends(name="0", legends=["0", "", ')']),
-    riskeyboard70_double_legends(name="equal", legends=["=", "", '+']),
-    riskeyboard70_double_legends(name="gt", legends=[".", "", '">"']),
-    riskeyboard70_double_legends(name="lt", legends=[",", "", '"<"']),
-    riskeyboard70_tick(name="tick", legends=[r"`", "", "~"]),
-    riskeyboard70_double_legends(name="quote", legends=[r"'", "", r'\\\"']),
-    riskeyboard70_minus(name="minus", legends=["-", "", '_']),
-    riskeyboard70_1_4U(legends=["alt"]),
-    riskeyboard70_1_6U(name="LCtrl", legends=["ctrl"]),
-    riskeyboard70_1_6U(legends=["tab"]),
-    riskeyboard70_2U(legends=["caps"]),
-    riskeyboard70_2U(name="RCtrl", legends=["ctrl"]),
-    riskeyboard70_2U(name="RShift", legends=["shift"]),
-    riskeyboard70_bslash(name="bslash", legends=[r'\\\\', "", '"|"']),
-
-    # TODO: 2.6 and longer need supports on the sides
-    riskeyboard70_2_6U(name="LShift", legends=["shift"]),
-    # riskeyboard70_2_6U(name="backspace", legends=["\u2190"]),
-    riskeyboard70_enter(legends=["enter"]),
-    riskeyboard70_backspace(legends=["backspace"]),
-    riskeyboard70_leftSpace(name="LSpace", legends=[""], dish_invert=True),
-    riskeyboard70_rightSpace(name="RSpace", legends=[""], dish_invert=True),
-
-    # keys that don't work with windows terminal, either because of unicode or escape quotes
-    riskeyboard70_arrows(name="left", legends=["◀"]),
-    riskeyboard70_arrows(name="right", legends=["▶"]),
-    riskeyboard70_arrows(name="up", legends=["▲"]),
-    riskeyboard70_arrows(name="down", legends=["▼"]),
-]
+
+@functools.lru_cache(maxsize=None)
+def get_keycaps():
+    """
+    Returns the list of all the keycaps we can render.  It gets built on first
+    use rather than at import time since every worker process imports this
+    module too (on platforms that spawn rather than fork) and none of them
+    need it.
+    """
+    return [
+        # 1U keys
+        #riskeyboard70_double_legends(name="backslash", legends=["\\", "", "|"]),
+        #riskeyboard70_double_legends(name="gt", legends=[".", "", ">?"]),
+        #riskeyboard70_double_legends(name="lt", legends=[",", "", "<?"]),
+        riskeyboard70_alphas(name="blank", legends=[""]),
+        riskeyboard70_alphas(legends=["fn"]),
+        riskeyboard70_FKey(legends=["F1"]),
+        riskeyboard70_FKey(legends=["F2"]),
+        riskeyboard70_FKey(legends=["F3"]),
+        riskeyboard70_FKey(legends=["F4"]),
+        riskeyboard70_FKey(legends=["F5"]),
+        riskeyboard70_FKey(legends=["F6"]),
+        riskeyboard70_FKey(legends=["F7"]),
+        riskeyboard70_FKey(legends=["F8"]),
+        riskeyboard70_FKey(legends=["F9"]),
+        riskeyboard70_FKey(legends=["F10"]),
+        riskeyboard70_FKey(legends=["F11"]),
+        riskeyboard70_FKey(legends=["F12"]),
+        riskeyboard70_FKey(legends=["esc"]),
+        riskeyboard70_prtsc(name="prt", legends=["prt", "", "sc"]),
+        riskeyboard70_FKey(legends=["ins"]),
+        riskeyboard70_FKey(legends=["del"]),
+        riskeyboard70_home(name="home", legends=["\u2302"]), # ⌂
+        riskeyboard70_FKey(legends=["end"]),
+        riskeyboard70_pg_ptr(name="pup", legends=["pg", "", '\u25B2']), # ▲
+        riskeyboard70_pg_ptr(name="pdn", legends=["pg", "", '\u25BC']), # ▼
+
+        riskeyboard70_double_legends(name="1", legends=["1", "", '!']),
+        riskeyboard70_double_legends(name="2", legends=["2", "", '@']),
+        riskeyboard70_double_legends(name="3", legends=["3", "", '#']),
+        riskeyboard70_double_legends(name="4", legends=["4", "", '$']),
+        riskeyboard70_double_legends(name="5", legends=["5", "", '%']),
+        riskeyboard70_double_legends(name="6", legends=["6", "", '^']),
+        riskeyboard70_double_legends(name="7", legends=["7", "", '&']),
+        riskeyboard70_double_legends(name="8", legends=["8", "", '*']),
+        riskeyboard70_double_legends(name="9", legends=["9", "", '(']),
+        riskeyboard70_double_legends(name="0", legends=["0", "", ')']),
+        riskeyboard70_double_legends(name="equal", legends=["=", "", '+']),
+        riskeyboard70_double_legends(name="gt", legends=[".", "", '>']),
+        riskeyboard70_double_legends(name="lt", legends=[",", "", '<']),
+        riskeyboard70_tick(name="tick", legends=[r"`", "", "~"]),
+        riskeyboard70_double_legends(name="quote", legends=["'", "", '"']),
+        riskeyboard70_minus(name="minus", legends=["-", "", '_']),
+        riskeyboard70_1_4U(legends=["alt"]),
+        riskeyboard70_1_6U(name="LCtrl", legends=["ctrl"]),
+        riskeyboard70_1_6U(legends=["tab"]),
+        riskeyboard70_2U(legends=["caps"]),
+        riskeyboard70_2U(name="RCtrl", legends=["ctrl"]),
+        riskeyboard70_2U(name="RShift", legends=["shift"]),
+        riskeyboard70_bslash(name="bslash", legends=["\\", "", "|"]),
+
+        # TODO: 2.6 and longer need supports on the sides
+        riskeyboard70_2_6U(name="LShift", legends=["shift"]),
+        # riskeyboard70_2_6U(name="backspace", legends=["\u2190"]),
+        riskeyboard70_enter(legends=["enter"]),
+        riskeyboard70_backspace(legends=["backspace"]),
+        riskeyboard70_leftSpace(name="LSpace", legends=[""], dish_invert=True),
+        riskeyboard70_rightSpace(name="RSpace", legends=[""], dish_invert=True),
+
+        riskeyboard70_arrows(name="left", legends=["◀"]),
+        riskeyboard70_arrows(name="right", legends=["▶"]),
+        riskeyboard70_arrows(name="up", legends=["▲"]),
+        riskeyboard70_arrows(name="down", legends=["▼"]),
+    ]
+
+def __getattr__(name):
+    # Keeps `riskeyboard_70.KEYCAPS` working for anything that imports us
+    if name == "KEYCAPS":
+        return get_keycaps()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def print_keycaps():
     """
-    Prints the names of all keycaps in KEYCAPS.
+    Prints the names of all keycaps in `get_keycaps()`.
     """
-    print(Style.BRIGHT +
-          f"Here's all the keycaps we can render:\n" + Style.RESET_ALL)
-    keycap_names = ", ".join(a.name for a in KEYCAPS)
+    print(f"{HDR}Here's all the keycaps we can render:\n{END}")
+    keycap_names = ", ".join(a.name for a in get_keycaps())
     print(f"{keycap_names}")
 
+def _stl_name(keycap, kind):
+    """
+    Returns the name (sans `.stl`) of the file the *kind* (see
+    `_render_one()`) of *keycap* gets rendered to.
+    """
+    if kind == "legends":
+        return f"{keycap.name}_legends"
+    return keycap.name
+
+def _variant(keycap, kind, out):
+    """
+    Returns a copy of *keycap* set up to render the *kind* (see
+    `_render_one()`) of STL into *out*.  *keycap* itself is left alone.
+    """
+    keycap = copy(keycap) # So the caller's keycap keeps its name and render
+    keycap.output_path = out
+    if kind == "legends":
+        keycap.name = _stl_name(keycap, kind)
+        keycap.render = ["legends"]
+    return keycap
+
+def _render_one(keycap, out, kind,
+        cache_dir=None, force=False, on_line=None, quiet=False):
+    """
+    Renders *keycap* to *out*.  *kind* is either "stl" (the keycap itself) or
+    "legends" (just its legends as `{name}_legends.stl`, for multi-material,
+    non-transparent legends).  If *cache_dir* is given identical keycaps
+    rendered previously get hardlinked from there instead of re-rendered
+    (unless *force*).  *keycap* itself is never modified.  Normally runs in
+    a worker process so instead of printing anything it returns
+    `(name, retcode, output)` where *output* is everything that should be
+    printed about this STL.  If *on_line* is given each line gets passed to
+    it as soon as it's ready instead (and *output* is empty).  If *quiet* is
+    `True` OpenSCAD's output is thrown away unless the render fails.
+    """
+    log = []
+    emit = on_line or log.append
+    keycap = _variant(keycap, kind, out)
+    path = Path(out) / f"{keycap.name}.stl" # Once for all the messages
+    emit(f"{HDR}Rendering {path}...{END}")
+    cmd = str(keycap) # Built once; generate() reuses Keycap's cached argv
+    emit(cmd)
+    if not cache_dir:
+        # It might be a hardlink into the cache from an earlier (cached) run;
+        # don't let OpenSCAD write through it (cached_render() does the same)
+        path.unlink(missing_ok=True)
+    if quiet: # OpenSCAD's output only gets read if the render fails
+        if cache_dir:
+            retcode, output = keycap.cached_render(
+                cache_dir, refresh=force, quiet=True)
+        else:
+            retcode, output = keycap.generate(quiet=True)
+        if output:
+            emit(output)
+    # Collect OpenSCAD's output as it's printed instead of all at the end
+    elif cache_dir:
+        retcode, _ = keycap.cached_render(
+            cache_dir, on_line=emit, refresh=force)
+    else:
+        retcode = keycap.generate_streaming(emit)
+    if retcode == 0: # Success!
+        emit(f"{path} rendered successfully")
+    return keycap.name, retcode, "\n".join(log)
+
+def _copy_duplicates(out, name, copies, rendered=True):
+    """
+    Copies the freshly-rendered `{name}.stl` in *out* to each of the names
+    in *copies* (keycaps that would've rendered identically).  If *rendered*
+    is `False` (its render failed) nothing gets copied.  Returns the messages
+    to print about it.
+    """
+    src = Path(out) / f"{name}.stl"
+    lines = []
+    for copy_name in copies:
+        dst = Path(out) / f"{copy_name}.stl"
+        if not rendered:
+            lines.append(f"{HDR}{dst} skipped ({src} failed){END}")
+            continue
+        try:
+            # Might be a hardlink into the cache; don't copy through it
+            dst.unlink(missing_ok=True)
+            shutil.copy(src, dst)
+        except OSError as e: # e.g. OpenSCAD "succeeded" without writing src
+            lines.append(f"{HDR}{dst} failed: couldn't copy {src}: {e}{END}")
+        else:
+            lines.append(f"{dst} is identical to {src}; copied")
+    return lines
+
+def _positive_int(value):
+    """
+    An `argparse` type for options that need a whole number >= 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a whole number: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1 (got {value!r})")
+    return number
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Render keycap STLs for all the Riskeyboard 70's switches.")
@@ -766,6 +963,26 @@ if __name__ == "__main__":
     parser.add_argument('--legends',
         required=False, action='store_true',
         help='If True, generate a separate set of STLs for legends.')
+    parser.add_argument('--cache',
+        metavar='<filepath>', type=str,
+        default=os.path.expanduser("~/.cache/riskeyboard"),
+        help='Where to cache rendered STLs so identical keycaps only get '
+             'rendered once (default: %(default)s).')
+    parser.add_argument('--no-cache',
+        required=False, action='store_true',
+        help="If True, don't use (or update) the STL cache.")
+    parser.add_argument('-j', '--jobs',
+        metavar='<n>', type=_positive_int, default=os.cpu_count() or 1,
+        help='How many OpenSCAD renders to run at once (default: %(default)s, '
+             'one per CPU).  Lower this if you run out of memory.')
+    parser.add_argument('--single-scad',
+        required=False, action='store_true',
+        help='If True, render everything from one generated .scad file holding '
+             "all the keycaps' parameters instead of passing them to OpenSCAD "
+             'on the command line (the STL cache is not used).')
+    parser.add_argument('--quiet',
+        required=False, action='store_true',
+        help="If True, don't show OpenSCAD's output unless a render fails.")
     parser.add_argument('--keycaps',
         required=False, action='store_true',
         help='If True, prints out the names of all keycaps we can render.')
@@ -782,93 +999,116 @@ if __name__ == "__main__":
     if args.keycaps:
         print_keycaps()
         sys.exit(1)
-    if not os.path.exists(args.out):
-        print(Style.BRIGHT +
-              f"Output path, '{args.out}' does not exist; making it..."
-              + Style.RESET_ALL)
-        os.mkdir(args.out)
-    print(Style.BRIGHT + f"Outputting to: {args.out}" + Style.RESET_ALL)
+    if not os.path.isdir(args.out):
+        print(f"{HDR}Output path, '{args.out}' does not exist; "
+              f"making it...{END}")
+    # Once, up front (exist_ok so nothing else making it can trip us up)
+    os.makedirs(args.out, exist_ok=True)
+    print(f"{HDR}Outputting to: {args.out}{END}")
+    # One directory listing up front instead of checking each STL separately
+    existing = set()
+    if not args.force:
+        with os.scandir(args.out) as entries: # Closes the handle right away
+            existing = {e.name for e in entries if e.name.endswith(".stl")}
     if args.names: # Just render the specified keycaps
-        matched = False
+        by_name = {k.name.lower(): k for k in get_keycaps()}
+        keycaps = []
         for name in args.names:
-            for keycap in KEYCAPS:
-                if keycap.name.lower() == name.lower():
-                    keycap.output_path = f"{args.out}"
-                    matched = True
-                    exists = False
-                    if not args.force:
-                        if os.path.exists(f"{args.out}/{keycap.name}.stl"):
-                            print(Style.BRIGHT +
-                                f"{args.out}/{keycap.name}.stl exists; "
-                                f"skipping..."
-                                + Style.RESET_ALL)
-                            exists = True
-                    if not exists:
-                        print(Style.BRIGHT +
-                            f"Rendering {args.out}/{keycap.name}.stl..."
-                            + Style.RESET_ALL)
-                        print(keycap)
-                        retcode, output = getstatusoutput(str(keycap))
-                        print(output)
-                        if retcode == 0: # Success!
-                            print(
-                                f"{args.out}/{keycap.name}.stl "
-                                f"rendered successfully")
-                    if args.legends:
-                        keycap.name = f"{keycap.name}_legends"
-                        if os.path.exists(f"{args.out}/{keycap.name}.stl"):
-                            print(Style.BRIGHT +
-                                f"{args.out}/{keycap.name}.stl exists; "
-                                f"skipping..."
-                                + Style.RESET_ALL)
-                            continue
-                        print(Style.BRIGHT +
-                            f"Rendering {args.out}/{keycap.name}.stl..."
-                            + Style.RESET_ALL)
-                        print(keycap)
-                        retcode, output = getstatusoutput(str(keycap))
-                        if retcode == 0: # Success!
-                            print(
-                                f"{args.out}/{keycap.name}.stl "
-                                f"rendered successfully")
-        if not matched:
-            print(f"Cound not find a keycap named {name}")
+            keycap = by_name.get(name.lower())
+            if keycap is None:
+                print(f"Cound not find a keycap named {name}")
+                continue
+            keycaps.append(keycap)
+    else:
+        keycaps = get_keycaps()
+    # First the keycaps then (optionally) their legends as separate tasks so
+    # they can all render in parallel.  Whatever already exists gets weeded
+    # out here so it never has to go through the pool.
+    jobs = [(keycap, "stl") for keycap in keycaps]
+    if args.legends:
+        jobs += [
+            (keycap, "legends") for keycap in keycaps
+            if any(keycap.legends) # Skip keycaps with no actual legends
+        ]
+    out = Path(args.out)
+    tasks = []
+    for keycap, kind in jobs:
+        filename = f"{_stl_name(keycap, kind)}.stl"
+        if filename in existing:
+            print(f"{HDR}{out / filename} exists; skipping...{END}")
+        else:
+            tasks.append((keycap, kind))
+    # Lots of keycaps come out exactly the same (blanks, etc) so only render
+    # the first of each and copy it for the rest.  Same key as the STL cache
+    # which catches repeats across runs; this catches them within one.
+    seen, duplicates, unique, names = {}, {}, [], set()
+    for keycap, kind in tasks:
+        name = _stl_name(keycap, kind)
+        if name in names:
+            continue # Same name given twice on the command line
+        names.add(name)
+        key = cache_key(_variant(keycap, kind, args.out))
+        if key in seen:
+            duplicates[seen[key]].append(name)
+        else:
+            seen[key] = name
+            duplicates[name] = []
+            unique.append((keycap, kind))
+    tasks = unique
+    # OpenSCAD is single-threaded so render one STL per core (or --jobs).  We
+    # ask OpenSCAD what it supports just once and hand that to the workers so
+    # they don't all have to.
+    caps = {str(path): openscad_caps(path)
+            for path in {keycap.openscad_path for keycap in keycaps}}
+    cache_dir = None if args.no_cache else args.cache
+    if args.single_scad and tasks:
+        # One driver .scad for everything; each render just gets -D IDX=<n>
+        variants = [_variant(keycap, kind, args.out) for keycap, kind in tasks]
+        with KeycapServer(variants) as server:
+            print(f"{HDR}Rendering {len(variants)} STLs via {server.driver}"
+                  f"...{END}")
+            results = server.render_all(
+                workers=args.jobs, quiet=args.quiet)
+        for variant, (retcode, output) in zip(variants, results):
+            path = out / f"{variant.name}.stl"
+            status = "rendered successfully" if retcode == 0 else "failed"
+            if output: # Nothing at all with --quiet unless it failed
+                sys.stdout.write(output + "\n")
+            sys.stdout.write(f"{path} {status}\n")
+            for line in _copy_duplicates(args.out, variant.name,
+                    duplicates[variant.name], rendered=retcode == 0):
+                sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+    elif args.jobs == 1:
+        # No point in a pool; render right here so OpenSCAD's output shows up
+        # as it happens.
+        for keycap, kind in tasks:
+            name, retcode, _ = _render_one(
+                keycap, args.out, kind, cache_dir, args.force,
+                on_line=functools.partial(print, flush=True),
+                quiet=args.quiet)
+            for line in _copy_duplicates(
+                    args.out, name, duplicates[name], rendered=retcode == 0):
+                print(line, flush=True)
     else:
-        # First render the keycaps
-        for keycap in KEYCAPS:
-            keycap.output_path = f"{args.out}"
-            if not args.force:
-                if os.path.exists(f"{args.out}/{keycap.name}.stl"):
-                    print(Style.BRIGHT +
-                        f"{args.out}/{keycap.name}.stl exists; skipping..."
-                        + Style.RESET_ALL)
-                    continue
-            print(Style.BRIGHT +
-                f"Rendering {args.out}/{keycap.name}.stl..."
-                + Style.RESET_ALL)
-            print(keycap)
-            retcode, output = getstatusoutput(str(keycap))
-            if retcode == 0: # Success!
-                print(f"{args.out}/{keycap.name}.stl rendered successfully")
-            print(output)
-        # Next render the legends (for multi-material, non-transparent legends)
-        if args.legends:
-            for legend in KEYCAPS:
-                if legend.legends == [""]:
-                    continue # No actual legends
-                legend.name = f"{legend.name}_legends"
-                legend.output_path = f"{args.out}"
-                legend.render = ["legends"]
-                if not args.force:
-                    if os.path.exists(f"{args.out}/{legend.name}.stl"):
-                        print(Style.BRIGHT +
-                            f"{args.out}/{legend.name}.stl exists; skipping..."
-                            + Style.RESET_ALL)
-                        continue
-                print(Style.BRIGHT +
-                    f"Rendering {args.out}/{legend.name}.stl..."
-                    + Style.RESET_ALL)
-                print(legend)
-                retcode, output = getstatusoutput(str(legend))
-                if retcode == 0: # Success!
-                    print(f"{args.out}/{legend.name}.stl rendered successfully")
+        with ProcessPoolExecutor(max_workers=args.jobs,
+                initializer=seed_openscad_caps, initargs=(caps,)) as executor:
+            futures = {
+                executor.submit(
+                    _render_one, keycap, args.out, kind, cache_dir, args.force,
+                    quiet=args.quiet
+                ): (keycap, kind)
+                for keycap, kind in tasks
+            }
+            for future in as_completed(futures):
+                try:
+                    name, retcode, output = future.result()
+                except Exception as e: # Don't let one bad keycap stop the rest
+                    name, retcode = _stl_name(*futures[future]), None
+                    output = f"{HDR}{out / name}.stl failed: {e!r}{END}"
+                output = "\n".join([output] + _copy_duplicates(
+                    args.out, name, duplicates[name], rendered=retcode == 0))
+                # One write per keycap (and flushed so progress shows up
+                # promptly even when stdout is piped somewhere)
+                sys.stdout.write(output + "\n")
+                sys.stdout.flush()